@@ -1,13 +1,37 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .__about__ import __version__
-from .client import TlyClient
 from .endpoints import ENDPOINTS, SUPPORTED_METHODS
 from .exceptions import TlyAPIError, TlyError
 
+if TYPE_CHECKING:
+    from .async_client import AsyncTlyClient
+    from .client import TlyClient
+
 __all__ = [
-    "__version__",
     "ENDPOINTS",
     "SUPPORTED_METHODS",
+    "AsyncTlyClient",
     "TlyAPIError",
     "TlyClient",
     "TlyError",
+    "__version__",
 ]
+
+# The clients pull in requests/httpx, so they are imported on first access.
+_LAZY_ATTRIBUTES = {
+    "AsyncTlyClient": ".async_client",
+    "TlyClient": ".client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+# The optional modules are only referenced behind these flags.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_SIMDJSON = False
+else:
+    _HAS_SIMDJSON = True
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if _HAS_ORJSON:
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(value: Any, *, indent: bool = False) -> bytes:
+        # Non-str keys are stringified, as the stdlib fallback does.
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_default, option=option)
+
+else:  # pragma: no cover - depends on the environment
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(value: Any, *, indent: bool = False) -> bytes:
+        if indent:
+            text = json.dumps(value, indent=2, ensure_ascii=False, default=_default)
+        else:
+            text = json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_default)
+        return text.encode("utf-8")
+
+
+def first_byte(data: bytes) -> bytes:
+    """Return the first non-whitespace byte of ``data``, or ``b""`` if there is none."""
+    index = 0
+    length = len(data)
+    while index < length and data[index] in b" \t\r\n":
+        index += 1
+    return data[index : index + 1]
+
+
+_parsers = threading.local()
+
+
+def _simdjson_parser() -> Any:
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = simdjson.Parser()
+    return parser
+
+
+def _is_object(value: Any) -> bool:
+    if isinstance(value, Mapping):
+        return True
+    return _HAS_SIMDJSON and isinstance(value, simdjson.Object)
+
+
+def _is_array(value: Any) -> bool:
+    if isinstance(value, list):
+        return True
+    return _HAS_SIMDJSON and isinstance(value, simdjson.Array)
+
+
+def _plain(value: Any) -> Any:
+    if _HAS_SIMDJSON:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
+
+def _project_records(records: Any, fields: Sequence[str]) -> list[Any]:
+    return [
+        {key: _plain(record[key]) for key in fields if key in record}
+        if _is_object(record)
+        else _plain(record)
+        for record in records
+    ]
+
+
+def _project(document: Any, fields: Sequence[str]) -> Any:
+    if _is_array(document):
+        return _project_records(document, fields)
+    if _is_object(document) and _is_array(document.get("data")):
+        projected = {key: _plain(document[key]) for key in document if key != "data"}
+        projected["data"] = _project_records(document["data"], fields)
+        return projected
+    return _plain(document)
+
+
+def loads_projected(data: bytes, fields: Sequence[str]) -> Any:
+    """Decode a list payload, keeping only ``fields`` from each record.
+
+    Records are read from a top-level array or from the ``data`` array of a
+    paginated object. With pysimdjson installed, unused keys are never
+    materialized as Python objects.
+    """
+    if not _HAS_SIMDJSON:
+        return _project(loads(data), fields)
+    try:
+        document = _simdjson_parser().parse(data)
+    except RuntimeError:
+        # The cached parser still backs a live document; use a fresh one.
+        document = simdjson.Parser().parse(data)
+    return _project(document, fields)
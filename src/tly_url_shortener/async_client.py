@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable, Mapping, Sequence
+from typing import Any
+
+from . import _json
+from .client import QRCode, _BaseTlyClient
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_HTTPX = False
+else:
+    _HAS_HTTPX = True
+
+
+def _check_concurrency(concurrency: int) -> None:
+    # asyncio.Semaphore(0) would block every call forever.
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+class AsyncTlyClient(
+    _BaseTlyClient[
+        Awaitable[dict[str, Any]],
+        Awaitable[list[dict[str, Any]]],
+        Awaitable[QRCode],
+        "Awaitable[httpx.Response]",
+    ]
+):
+    """Asyncio client for the T.LY URL Shortener API.
+
+    Exposes the same endpoint methods as ``TlyClient``; each one returns an
+    awaitable. Requires the ``async`` extra (``httpx`` with HTTP/2 support).
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        *,
+        base_url: str = "https://api.t.ly",
+        timeout: float = 30.0,
+        user_agent: str = "tly-url-shortener-api/0.1.0",
+        client: httpx.AsyncClient | None = None,
+        concurrency: int = 32,
+    ) -> None:
+        super().__init__(api_token, base_url=base_url, timeout=timeout, user_agent=user_agent)
+        _check_concurrency(concurrency)
+        if client is None:
+            if not _HAS_HTTPX:
+                raise ImportError(
+                    "AsyncTlyClient requires httpx; install tly-url-shortener-api[async]"
+                )
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=concurrency,
+                    max_keepalive_connections=concurrency,
+                ),
+            )
+        self.client = client
+        self.concurrency = concurrency
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncTlyClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | Sequence[tuple[str, Any]] | None = None,
+        json_body: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        expect_binary: bool = False,
+        fields: Sequence[str] | None = None,
+        stream: bool = False,
+    ) -> Any:
+        if params is not None and not isinstance(params, Mapping):
+            # httpx only takes pair sequences as a list or tuple.
+            params = list(params)
+        http_request = self.client.build_request(
+            method.upper(),
+            self._build_url(path),
+            params=params,
+            content=_json.dumps(json_body) if json_body is not None else None,
+            headers=self._build_headers(headers),
+            timeout=self.timeout,
+        )
+        response = await self.client.send(http_request, stream=stream)
+        if stream and (not expect_binary or response.status_code >= 400):
+            await response.aread()
+        self._raise_for_status(response)
+        if expect_binary and stream:
+            return response
+        return self._parse_response(response, expect_binary=expect_binary, fields=fields)
+
+    async def gather_calls(
+        self,
+        method: str,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int | None = None,
+    ) -> list[Any]:
+        """Call ``method`` once per payload, running up to ``concurrency`` at a time.
+
+        Results are returned in payload order. A failed call yields its
+        exception in place of a result, so one error never discards links the
+        other calls already created. If the batch itself is cancelled, calls
+        still in flight are cancelled and awaited before it returns.
+        """
+        if concurrency is None:
+            concurrency = self.concurrency
+        _check_concurrency(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        endpoint = getattr(self, method)
+
+        async def call(payload: Mapping[str, Any]) -> Any:
+            async with semaphore:
+                return await endpoint(**payload)
+
+        tasks = [asyncio.ensure_future(call(payload)) for payload in payloads]
+        try:
+            return list(await asyncio.gather(*tasks, return_exceptions=True))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def gather_shorten(
+        self,
+        long_urls: Iterable[str],
+        *,
+        concurrency: int | None = None,
+        **options: Any,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Shorten many URLs concurrently; ``options`` apply to every link.
+
+        As with ``gather_calls``, a failed URL yields its exception.
+        """
+        payloads = ({"long_url": long_url, **options} for long_url in long_urls)
+        return await self.gather_calls("create_short_link", payloads, concurrency=concurrency)
@@ -1,34 +1,39 @@
 from __future__ import annotations
 
 import argparse
-import json
+import operator
 import os
+import shutil
 import sys
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any
 
-from .client import TlyClient
 from .endpoints import SUPPORTED_METHODS
 from .exceptions import TlyAPIError
 
+_METHOD_GETTERS = {name: operator.attrgetter(name) for name in SUPPORTED_METHODS}
 
-def _parse_data(raw: str | None) -> dict[str, Any]:
+
+def _parse_data(raw: str | None, *, allow_list: bool = False) -> Any:
     if not raw:
         return {}
-    data = json.loads(raw)
-    if not isinstance(data, dict):
-        raise ValueError("--data must be a JSON object")
-    return data
-
+    from . import _json
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="tly", description="T.LY URL Shortener API CLI")
-    parser.add_argument("--token", default=os.getenv("TLY_API_TOKEN"), help="API token")
-    parser.add_argument("--base-url", default=os.getenv("TLY_BASE_URL", "https://api.t.ly"))
-    parser.add_argument("--timeout", type=float, default=30.0)
+    # Check the leading byte so non-objects are rejected before being decoded.
+    body = raw.encode("utf-8")
+    first = _json.first_byte(body)
+    if first == b"{":
+        return _json.loads(body)
+    if allow_list and first == b"[":
+        data = _json.loads(body)
+        if all(isinstance(item, dict) for item in data):
+            return data
+    if allow_list:
+        raise ValueError("--data must be a JSON object or an array of objects")
+    raise ValueError("--data must be a JSON object")
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
-    shorten = subparsers.add_parser("shorten", help="Create a short link")
+def _add_shorten_arguments(shorten: argparse.ArgumentParser) -> None:
     shorten.add_argument("--long-url", required=True)
     shorten.add_argument("--domain")
     shorten.add_argument("--description")
@@ -36,26 +41,124 @@ def _build_parser() -> argparse.ArgumentParser:
     shorten.add_argument("--public-stats", action="store_true")
     shorten.add_argument("--meta-json")
 
-    expand = subparsers.add_parser("expand", help="Expand a short link")
+
+def _add_expand_arguments(expand: argparse.ArgumentParser) -> None:
     expand.add_argument("--short-url", required=True)
     expand.add_argument("--password")
 
-    qr = subparsers.add_parser("qr", help="Get QR code (binary image by default)")
+
+def _add_qr_arguments(qr: argparse.ArgumentParser) -> None:
     qr.add_argument("--short-url", required=True)
     qr.add_argument("--output", choices=["image", "base64"], default="image")
     qr.add_argument("--format", choices=["png", "eps"], default="png")
     qr.add_argument("--out", help="Output file path for binary QR image")
 
-    call = subparsers.add_parser("call", help="Call any supported client method")
-    call.add_argument("method", choices=SUPPORTED_METHODS)
+
+def _positive_int(raw: str) -> int:
+    value = int(raw)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {raw!r}")
+    return value
+
+
+class _MethodAction(argparse.Action):
+    """Validate a client method name with a set lookup instead of ``choices``."""
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        if values not in SUPPORTED_METHODS:
+            choices = ", ".join(sorted(SUPPORTED_METHODS))
+            parser.error(f"argument method: invalid choice: {values!r} (choose from {choices})")
+        setattr(namespace, self.dest, values)
+
+
+def _add_call_arguments(call: argparse.ArgumentParser) -> None:
+    call.add_argument(
+        "method",
+        action=_MethodAction,
+        metavar="{" + ",".join(sorted(SUPPORTED_METHODS)) + "}",
+        help="Client method name, e.g. create_tag",
+    )
     call.add_argument("--data", help='JSON object, example: \'{"tag":"fall2026"}\'')
+    call.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the async client; --data may then be an array of objects called concurrently",
+    )
+    call.add_argument("--concurrency", type=_positive_int, default=32)
+
+
+_COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "shorten": ("Create a short link", _add_shorten_arguments),
+    "expand": ("Expand a short link", _add_expand_arguments),
+    "qr": ("Get QR code (binary image by default)", _add_qr_arguments),
+    "call": ("Call any supported client method", _add_call_arguments),
+}
+
+_VALUE_OPTIONS = frozenset({"--token", "--base-url", "--timeout"})
+
+
+def _find_command(argv: Sequence[str]) -> str | None:
+    args = iter(argv)
+    for arg in args:
+        if arg in _VALUE_OPTIONS:
+            next(args, None)
+        elif arg in _COMMANDS:
+            return arg
+    return None
+
+
+def _build_parser(commands: Iterable[str] = _COMMANDS) -> argparse.ArgumentParser:
+    """Build the CLI parser, adding subcommand arguments only for ``commands``."""
+    # No abbreviations: _find_command only recognises the full option names.
+    parser = argparse.ArgumentParser(
+        prog="tly", description="T.LY URL Shortener API CLI", allow_abbrev=False
+    )
+    parser.add_argument("--token", default=os.getenv("TLY_API_TOKEN"), help="API token")
+    parser.add_argument("--base-url", default=os.getenv("TLY_BASE_URL", "https://api.t.ly"))
+    parser.add_argument("--timeout", type=float, default=30.0)
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    commands = set(commands)
+    for name, (help_text, add_arguments) in _COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name in commands:
+            add_arguments(subparser)
 
     return parser
 
 
+def _stream_to_file(response: Any, path: str) -> None:
+    """Copy a streamed response to ``path``; a failed download leaves no file behind."""
+    import tempfile
+
+    fd, partial = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".part")
+    try:
+        with response, os.fdopen(fd, "wb") as f:
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f)
+        # mkstemp creates the file 0600; give it the mode open() would have.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(partial, 0o666 & ~umask)
+        os.replace(partial, path)
+    except BaseException:
+        os.unlink(partial)
+        raise
+
+
 def _print_result(result: Any) -> int:
     if isinstance(result, (dict, list)):
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        from . import _json
+
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_json.dumps(result, indent=True) + b"\n")
         return 0
     if isinstance(result, (bytes, bytearray)):
         sys.stdout.buffer.write(result)
@@ -64,17 +167,61 @@ def _print_result(result: Any) -> int:
     return 0
 
 
+def _outcome(item: Any) -> Any:
+    if isinstance(item, TlyAPIError):
+        return {"error": item.message, "status_code": item.status_code}
+    if isinstance(item, BaseException):
+        return {"error": str(item) or type(item).__name__}
+    return item
+
+
+async def _call_async(args: argparse.Namespace, payload: Any) -> Any:
+    from .async_client import AsyncTlyClient
+
+    async with AsyncTlyClient(
+        api_token=args.token,
+        base_url=args.base_url,
+        timeout=args.timeout,
+        concurrency=args.concurrency,
+    ) as client:
+        if isinstance(payload, list):
+            return await client.gather_calls(args.method, payload)
+        return await _METHOD_GETTERS[args.method](client)(**payload)
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    command = _find_command(argv)
+    parser = _build_parser(commands=(command,) if command else ())
     args = parser.parse_args(argv)
 
     if not args.token:
         parser.error("Missing token. Provide --token or set TLY_API_TOKEN.")
 
+    # Deferred so that --help and usage errors never import requests.
+    from . import _json
+    from .client import TlyClient
+
     try:
-        with TlyClient(api_token=args.token, base_url=args.base_url, timeout=args.timeout) as client:
+        if args.command == "call" and args.use_async:
+            payload = _parse_data(args.data, allow_list=True)
+            import asyncio
+
+            result = asyncio.run(_call_async(args, payload))
+            if not isinstance(payload, list):
+                return _print_result(result)
+            # One entry per payload; failed calls are reported in place.
+            _print_result([_outcome(item) for item in result])
+            return 1 if any(isinstance(item, BaseException) for item in result) else 0
+
+        with TlyClient(
+            api_token=args.token,
+            base_url=args.base_url,
+            timeout=args.timeout,
+        ) as client:
             if args.command == "shorten":
-                meta = json.loads(args.meta_json) if args.meta_json else None
+                meta = _json.loads(args.meta_json) if args.meta_json else None
                 result = client.create_short_link(
                     long_url=args.long_url,
                     domain=args.domain,
@@ -90,30 +237,35 @@ def main(argv: list[str] | None = None) -> int:
                 return _print_result(result)
 
             if args.command == "qr":
+                if args.out and args.output == "image":
+                    response = client.get_qr_code(
+                        short_url=args.short_url,
+                        output=args.output,
+                        fmt=args.format,
+                        stream=True,
+                    )
+                    _stream_to_file(response, args.out)
+                    print(args.out)
+                    return 0
                 result = client.get_qr_code(
                     short_url=args.short_url,
                     output=args.output,
                     fmt=args.format,
                 )
                 if isinstance(result, bytes):
-                    if args.out:
-                        with open(args.out, "wb") as f:
-                            f.write(result)
-                        print(args.out)
-                        return 0
                     sys.stdout.buffer.write(result)
                     return 0
                 return _print_result(result)
 
             if args.command == "call":
                 payload = _parse_data(args.data)
-                method = getattr(client, args.method)
+                method = _METHOD_GETTERS[args.method](client)
                 result = method(**payload)
                 return _print_result(result)
 
             parser.error(f"Unknown command: {args.command}")
             return 2
-    except json.JSONDecodeError as exc:
+    except _json.JSONDecodeError as exc:
         print(f"Invalid JSON input: {exc}", file=sys.stderr)
         return 2
     except ValueError as exc:
@@ -1,26 +1,72 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import logging
+import socket
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping, Sequence
 from datetime import date, datetime
-from typing import Any, Union
-from urllib.parse import urljoin
+from typing import Any, Generic, Literal, NamedTuple, TypeVar, Union, overload
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
+from . import _json
 from .exceptions import TlyAPIError
 
 JSONScalar = Union[str, int, float, bool, None]
 JSONValue = Union[JSONScalar, dict[str, "JSONValue"], list["JSONValue"]]
 
+QRCode = Union[bytes, dict[str, Any]]
+
+# What endpoint wrappers return for a JSON object, a list of objects, a QR
+# code, and a streamed QR image.
+_ObjectT = TypeVar("_ObjectT")
+_ListT = TypeVar("_ListT")
+_QRCodeT = TypeVar("_QRCodeT")
+_StreamT = TypeVar("_StreamT")
+
+logger = logging.getLogger(__name__)
+
+# POST is left out: creating a link twice is worse than surfacing a 5xx.
+_RETRY_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+
+def _keepalive_socket_options() -> list[tuple[int, int, int]]:
+    options = [
+        *HTTPConnection.default_socket_options,
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # Start probing well before typical NAT idle timeouts where the platform allows it.
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+_KEEPALIVE_SOCKET_OPTIONS = _keepalive_socket_options()
+
+# Upper bound on how long close() waits for an unfinished preconnect.
+_PRECONNECT_JOIN_TIMEOUT = 1.0
+
 
 def _as_iso(value: date | datetime | str | None) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, (date, datetime)):
+    if value is None or type(value) is str:
+        return value
+    if isinstance(value, date):  # also covers datetime
         return value.isoformat()
     return value
 
 
+def _payload(*items: tuple[str, Any]) -> dict[str, Any]:
+    """Build a request payload from ``(key, value)`` pairs, dropping ``None`` values."""
+    return {key: value for key, value in items if value is not None}
+
+
 def _add_indexed_params(
     target: list[tuple[str, str]],
     key: str,
@@ -28,12 +74,19 @@ def _add_indexed_params(
 ) -> None:
     if not values:
         return
-    for idx, value in enumerate(values):
-        target.append((f"{key}[{idx}]", str(value)))
+    target.extend(
+        (f"{key}[{idx}]", value if type(value) is str else str(value))
+        for idx, value in enumerate(values)
+    )
 
 
-class TlyClient:
-    """Python client for the T.LY URL Shortener API."""
+class _BaseTlyClient(ABC, Generic[_ObjectT, _ListT, _QRCodeT, _StreamT]):
+    """Request helpers and endpoint wrappers shared by the sync and async clients.
+
+    Subclasses provide ``request``; every endpoint wrapper returns its result
+    unchanged, so on the async client the wrappers return awaitables. The type
+    parameters spell out those return types for each client.
+    """
 
     def __init__(
         self,
@@ -42,41 +95,37 @@ class TlyClient:
         base_url: str = "https://api.t.ly",
         timeout: float = 30.0,
         user_agent: str = "tly-url-shortener-api/0.1.0",
-        session: requests.Session | None = None,
     ) -> None:
         if not api_token:
             raise ValueError("api_token is required")
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = session or requests.Session()
-        self.default_headers = {
-            "Authorization": f"Bearer {api_token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": user_agent,
-        }
-
-    def close(self) -> None:
-        self.session.close()
-
-    def __enter__(self) -> "TlyClient":
-        return self
-
-    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        self.close()
+        self.default_headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(
+            {
+                "Authorization": f"Bearer {api_token}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": user_agent,
+            }
+        )
 
-    def _build_headers(self, headers: Mapping[str, str] | None) -> dict[str, str]:
-        merged = dict(self.default_headers)
-        if headers:
-            merged.update(dict(headers))
+    def _build_headers(self, headers: Mapping[str, str] | None) -> Mapping[str, str]:
+        # Both HTTP libraries copy request headers before merging them, so the
+        # defaults can be passed through as-is when nothing is overridden.
+        if not headers:
+            return self.default_headers
+        merged = self.default_headers.copy()
+        merged.update(headers)
         return merged
 
-    def _normalize_path(self, path: str) -> str:
-        return path if path.startswith("/") else f"/{path}"
+    def _build_url(self, path: str) -> str:
+        if path[:1] == "/":
+            return self.base_url + path
+        return f"{self.base_url}/{path}"
 
-    def _extract_error_message(self, response: requests.Response) -> str:
+    def _extract_error_message(self, response: Any) -> str:
         try:
-            payload = response.json()
+            payload = _json.loads(response.content)
         except ValueError:
             return response.text or "Request failed"
 
@@ -89,18 +138,35 @@ class TlyClient:
                 return str(payload["errors"])
         return str(payload)
 
-    def _parse_response(self, response: requests.Response, expect_binary: bool) -> Any:
+    def _raise_for_status(self, response: Any) -> None:
+        if response.status_code >= 400:
+            raise TlyAPIError(
+                status_code=response.status_code,
+                message=self._extract_error_message(response),
+                response_body=response.text,
+            )
+
+    def _parse_response(
+        self,
+        response: Any,
+        expect_binary: bool,
+        fields: Sequence[str] | None = None,
+    ) -> Any:
         if expect_binary:
             return response.content
 
-        text = response.text.strip()
-        if not text:
+        body = response.content
+        first = _json.first_byte(body)
+        if not first:
             return {}
         content_type = response.headers.get("Content-Type", "").lower()
-        if "application/json" in content_type or text.startswith(("{", "[")):
-            return response.json()
-        return text
+        if "application/json" in content_type or first in (b"{", b"["):
+            if fields is not None:
+                return _json.loads_projected(body, fields)
+            return _json.loads(body)
+        return response.text.strip()
 
+    @abstractmethod
     def request(
         self,
         method: str,
@@ -110,24 +176,15 @@ class TlyClient:
         json_body: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         expect_binary: bool = False,
+        fields: Sequence[str] | None = None,
+        stream: bool = False,
     ) -> Any:
-        normalized_path = self._normalize_path(path)
-        url = urljoin(f"{self.base_url}/", normalized_path.lstrip("/"))
-        response = self.session.request(
-            method=method.upper(),
-            url=url,
-            params=params,
-            json=json_body,
-            headers=self._build_headers(headers),
-            timeout=self.timeout,
-        )
-        if response.status_code >= 400:
-            raise TlyAPIError(
-                status_code=response.status_code,
-                message=self._extract_error_message(response),
-                response_body=response.text,
-            )
-        return self._parse_response(response, expect_binary=expect_binary)
+        """Send a request and return the decoded body.
+
+        With ``expect_binary`` and ``stream`` both set, the unread HTTP response
+        is returned instead so the caller can copy it elsewhere; the caller is
+        responsible for closing it.
+        """
 
     def get_onelink_stats(
         self,
@@ -135,15 +192,15 @@ class TlyClient:
         *,
         start_date: date | datetime | str | None = None,
         end_date: date | datetime | str | None = None,
-    ) -> dict[str, Any]:
-        params = {"short_url": short_url}
-        if start_date is not None:
-            params["start_date"] = _as_iso(start_date)
-        if end_date is not None:
-            params["end_date"] = _as_iso(end_date)
+    ) -> _ObjectT:
+        params = _payload(
+            ("short_url", short_url),
+            ("start_date", _as_iso(start_date)),
+            ("end_date", _as_iso(end_date)),
+        )
         return self.request("GET", "/api/v1/onelink/stats", params=params)
 
-    def delete_onelink_stats(self, short_url: str) -> dict[str, Any]:
+    def delete_onelink_stats(self, short_url: str) -> _ObjectT:
         return self.request(
             "DELETE",
             "/api/v1/onelink/stat",
@@ -159,21 +216,18 @@ class TlyClient:
         description: str | None = None,
         public_stats: bool | None = None,
         meta: JSONValue | None = None,
-    ) -> dict[str, Any]:
-        payload: dict[str, Any] = {"long_url": long_url}
-        if domain is not None:
-            payload["domain"] = domain
-        if expire_at_datetime is not None:
-            payload["expire_at_datetime"] = _as_iso(expire_at_datetime)
-        if description is not None:
-            payload["description"] = description
-        if public_stats is not None:
-            payload["public_stats"] = public_stats
-        if meta is not None:
-            payload["meta"] = meta
+    ) -> _ObjectT:
+        payload = _payload(
+            ("long_url", long_url),
+            ("domain", domain),
+            ("expire_at_datetime", _as_iso(expire_at_datetime)),
+            ("description", description),
+            ("public_stats", public_stats),
+            ("meta", meta),
+        )
         return self.request("POST", "/api/v1/link/shorten", json_body=payload)
 
-    def get_short_link(self, short_url: str) -> dict[str, Any]:
+    def get_short_link(self, short_url: str) -> _ObjectT:
         return self.request("GET", "/api/v1/link", params={"short_url": short_url})
 
     def update_short_link(
@@ -185,21 +239,18 @@ class TlyClient:
         description: str | None = None,
         public_stats: bool | None = None,
         meta: JSONValue | None = None,
-    ) -> dict[str, Any]:
-        payload: dict[str, Any] = {"short_url": short_url}
-        if long_url is not None:
-            payload["long_url"] = long_url
-        if expire_at_datetime is not None:
-            payload["expire_at_datetime"] = _as_iso(expire_at_datetime)
-        if description is not None:
-            payload["description"] = description
-        if public_stats is not None:
-            payload["public_stats"] = public_stats
-        if meta is not None:
-            payload["meta"] = meta
+    ) -> _ObjectT:
+        payload = _payload(
+            ("short_url", short_url),
+            ("long_url", long_url),
+            ("expire_at_datetime", _as_iso(expire_at_datetime)),
+            ("description", description),
+            ("public_stats", public_stats),
+            ("meta", meta),
+        )
         return self.request("PUT", "/api/v1/link", json_body=payload)
 
-    def delete_short_link(self, short_url: str) -> dict[str, Any]:
+    def delete_short_link(self, short_url: str) -> _ObjectT:
         return self.request(
             "DELETE",
             "/api/v1/link",
@@ -211,10 +262,8 @@ class TlyClient:
         short_url: str,
         *,
         password: str | None = None,
-    ) -> dict[str, Any]:
-        payload: dict[str, Any] = {"short_url": short_url}
-        if password is not None:
-            payload["password"] = password
+    ) -> _ObjectT:
+        payload = _payload(("short_url", short_url), ("password", password))
         return self.request("POST", "/api/v1/link/expand", json_body=payload)
 
     def list_short_links(
@@ -226,7 +275,8 @@ class TlyClient:
         domains: Sequence[int | str] | None = None,
         start_date: date | datetime | str | None = None,
         end_date: date | datetime | str | None = None,
-    ) -> dict[str, Any]:
+        fields: Sequence[str] | None = None,
+    ) -> _ObjectT:
         params: list[tuple[str, str]] = []
         if search is not None:
             params.append(("search", search))
@@ -237,7 +287,7 @@ class TlyClient:
             params.append(("start_date", _as_iso(start_date) or ""))
         if end_date is not None:
             params.append(("end_date", _as_iso(end_date) or ""))
-        return self.request("GET", "/api/v1/link/list", params=params)
+        return self.request("GET", "/api/v1/link/list", params=params, fields=fields)
 
     def bulk_shorten_links(
         self,
@@ -246,15 +296,15 @@ class TlyClient:
         domain: str | None = None,
         tags: Sequence[int | str] | None = None,
         pixels: Sequence[int | str] | None = None,
+        fields: Sequence[str] | None = None,
     ) -> Any:
-        payload: dict[str, Any] = {"links": links}
-        if domain is not None:
-            payload["domain"] = domain
-        if tags is not None:
-            payload["tags"] = list(tags)
-        if pixels is not None:
-            payload["pixels"] = list(pixels)
-        return self.request("POST", "/api/v1/link/bulk", json_body=payload)
+        payload = _payload(
+            ("links", links),
+            ("domain", domain),
+            ("tags", list(tags) if tags is not None else None),
+            ("pixels", list(pixels) if pixels is not None else None),
+        )
+        return self.request("POST", "/api/v1/link/bulk", json_body=payload, fields=fields)
 
     def bulk_update_links(
         self,
@@ -262,13 +312,16 @@ class TlyClient:
         *,
         tags: Sequence[int | str] | None = None,
         pixels: Sequence[int | str] | None = None,
+        fields: Sequence[str] | None = None,
     ) -> Any:
-        payload: dict[str, Any] = {"links": links}
-        if tags is not None:
-            payload["tags"] = list(tags)
-        if pixels is not None:
-            payload["pixels"] = list(pixels)
-        return self.request("POST", "/api/v1/link/bulk/update", json_body=payload)
+        payload = _payload(
+            ("links", links),
+            ("tags", list(tags) if tags is not None else None),
+            ("pixels", list(pixels) if pixels is not None else None),
+        )
+        return self.request(
+            "POST", "/api/v1/link/bulk/update", json_body=payload, fields=fields
+        )
 
     def get_link_stats(
         self,
@@ -276,12 +329,12 @@ class TlyClient:
         *,
         start_date: date | datetime | str | None = None,
         end_date: date | datetime | str | None = None,
-    ) -> dict[str, Any]:
-        params = {"short_url": short_url}
-        if start_date is not None:
-            params["start_date"] = _as_iso(start_date)
-        if end_date is not None:
-            params["end_date"] = _as_iso(end_date)
+    ) -> _ObjectT:
+        params = _payload(
+            ("short_url", short_url),
+            ("start_date", _as_iso(start_date)),
+            ("end_date", _as_iso(end_date)),
+        )
         return self.request("GET", "/api/v1/link/stats", params=params)
 
     def create_utm_preset(
@@ -293,23 +346,21 @@ class TlyClient:
         campaign: str,
         content: str | None = None,
         term: str | None = None,
-    ) -> dict[str, Any]:
-        payload: dict[str, Any] = {
-            "name": name,
-            "source": source,
-            "medium": medium,
-            "campaign": campaign,
-        }
-        if content is not None:
-            payload["content"] = content
-        if term is not None:
-            payload["term"] = term
+    ) -> _ObjectT:
+        payload = _payload(
+            ("name", name),
+            ("source", source),
+            ("medium", medium),
+            ("campaign", campaign),
+            ("content", content),
+            ("term", term),
+        )
         return self.request("POST", "/api/v1/link/utm-preset", json_body=payload)
 
-    def list_utm_presets(self) -> list[dict[str, Any]]:
-        return self.request("GET", "/api/v1/link/utm-preset")
+    def list_utm_presets(self, *, fields: Sequence[str] | None = None) -> _ListT:
+        return self.request("GET", "/api/v1/link/utm-preset", fields=fields)
 
-    def get_utm_preset(self, preset_id: int | str) -> dict[str, Any]:
+    def get_utm_preset(self, preset_id: int | str) -> _ObjectT:
         return self.request("GET", f"/api/v1/link/utm-preset/{preset_id}")
 
     def update_utm_preset(
@@ -322,26 +373,22 @@ class TlyClient:
         campaign: str,
         content: str | None = None,
         term: str | None = None,
-    ) -> dict[str, Any]:
-        payload: dict[str, Any] = {
-            "name": name,
-            "source": source,
-            "medium": medium,
-            "campaign": campaign,
-        }
-        if content is not None:
-            payload["content"] = content
-        if term is not None:
-            payload["term"] = term
+    ) -> _ObjectT:
+        payload = _payload(
+            ("name", name),
+            ("source", source),
+            ("medium", medium),
+            ("campaign", campaign),
+            ("content", content),
+            ("term", term),
+        )
         return self.request("PUT", f"/api/v1/link/utm-preset/{preset_id}", json_body=payload)
 
-    def delete_utm_preset(self, preset_id: int | str) -> dict[str, Any]:
+    def delete_utm_preset(self, preset_id: int | str) -> _ObjectT:
         return self.request("DELETE", f"/api/v1/link/utm-preset/{preset_id}")
 
-    def list_onelinks(self, *, page: int | None = 1) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if page is not None:
-            params["page"] = page
+    def list_onelinks(self, *, page: int | None = 1) -> _ObjectT:
+        params = _payload(("page", page))
         return self.request("GET", "/api/v1/onelink/list", params=params)
 
     def create_pixel(
@@ -350,17 +397,17 @@ class TlyClient:
         name: str,
         pixel_id: str,
         pixel_type: str,
-    ) -> dict[str, Any]:
+    ) -> _ObjectT:
         return self.request(
             "POST",
             "/api/v1/link/pixel",
             json_body={"name": name, "pixel_id": pixel_id, "pixel_type": pixel_type},
         )
 
-    def list_pixels(self) -> list[dict[str, Any]]:
-        return self.request("GET", "/api/v1/link/pixel")
+    def list_pixels(self, *, fields: Sequence[str] | None = None) -> _ListT:
+        return self.request("GET", "/api/v1/link/pixel", fields=fields)
 
-    def get_pixel(self, pixel_id: int | str) -> dict[str, Any]:
+    def get_pixel(self, pixel_id: int | str) -> _ObjectT:
         return self.request("GET", f"/api/v1/link/pixel/{pixel_id}")
 
     def update_pixel(
@@ -370,23 +417,54 @@ class TlyClient:
         name: str,
         pixel_id: str,
         pixel_type: str,
-    ) -> dict[str, Any]:
+    ) -> _ObjectT:
         return self.request(
             "PUT",
             f"/api/v1/link/pixel/{pixel_record_id}",
             json_body={"id": pixel_record_id, "name": name, "pixel_id": pixel_id, "pixel_type": pixel_type},
         )
 
-    def delete_pixel(self, pixel_id: int | str) -> dict[str, Any]:
+    def delete_pixel(self, pixel_id: int | str) -> _ObjectT:
         return self.request("DELETE", f"/api/v1/link/pixel/{pixel_id}")
 
+    @overload
+    def get_qr_code(
+        self,
+        short_url: str,
+        *,
+        output: str = ...,
+        fmt: str = ...,
+        stream: Literal[False] = ...,
+    ) -> _QRCodeT: ...
+
+    @overload
+    def get_qr_code(
+        self,
+        short_url: str,
+        *,
+        output: str = ...,
+        fmt: str = ...,
+        stream: Literal[True],
+    ) -> _StreamT: ...
+
+    @overload
+    def get_qr_code(
+        self,
+        short_url: str,
+        *,
+        output: str = ...,
+        fmt: str = ...,
+        stream: bool,
+    ) -> _QRCodeT | _StreamT: ...
+
     def get_qr_code(
         self,
         short_url: str,
         *,
         output: str = "image",
         fmt: str = "png",
-    ) -> bytes | dict[str, Any]:
+        stream: bool = False,
+    ) -> _QRCodeT | _StreamT:
         params = {"short_url": short_url, "output": output, "format": fmt}
         expect_binary = output == "image"
         headers = None
@@ -398,6 +476,7 @@ class TlyClient:
             params=params,
             expect_binary=expect_binary,
             headers=headers,
+            stream=stream,
         )
 
     def update_qr_code(
@@ -410,33 +489,222 @@ class TlyClient:
         dots_color: str | None = None,
         dots_style: str | None = None,
         corner_style: str | None = None,
-    ) -> dict[str, Any]:
-        payload: dict[str, Any] = {"short_url": short_url}
-        if image is not None:
-            payload["image"] = image
-        if background_color is not None:
-            payload["background_color"] = background_color
-        if corner_dots_color is not None:
-            payload["corner_dots_color"] = corner_dots_color
-        if dots_color is not None:
-            payload["dots_color"] = dots_color
-        if dots_style is not None:
-            payload["dots_style"] = dots_style
-        if corner_style is not None:
-            payload["corner_style"] = corner_style
+    ) -> _ObjectT:
+        payload = _payload(
+            ("short_url", short_url),
+            ("image", image),
+            ("background_color", background_color),
+            ("corner_dots_color", corner_dots_color),
+            ("dots_color", dots_color),
+            ("dots_style", dots_style),
+            ("corner_style", corner_style),
+        )
         return self.request("PUT", "/api/v1/link/qr-code", json_body=payload)
 
-    def list_tags(self) -> list[dict[str, Any]]:
-        return self.request("GET", "/api/v1/link/tag")
+    def list_tags(self, *, fields: Sequence[str] | None = None) -> _ListT:
+        return self.request("GET", "/api/v1/link/tag", fields=fields)
 
-    def create_tag(self, tag: str) -> dict[str, Any]:
+    def create_tag(self, tag: str) -> _ObjectT:
         return self.request("POST", "/api/v1/link/tag", json_body={"tag": tag})
 
-    def get_tag(self, tag_id: int | str) -> dict[str, Any]:
+    def get_tag(self, tag_id: int | str) -> _ObjectT:
         return self.request("GET", f"/api/v1/link/tag/{tag_id}")
 
-    def update_tag(self, tag_id: int | str, tag: str) -> dict[str, Any]:
+    def update_tag(self, tag_id: int | str, tag: str) -> _ObjectT:
         return self.request("PUT", f"/api/v1/link/tag/{tag_id}", json_body={"tag": tag})
 
-    def delete_tag(self, tag_id: int | str) -> dict[str, Any]:
+    def delete_tag(self, tag_id: int | str) -> _ObjectT:
         return self.request("DELETE", f"/api/v1/link/tag/{tag_id}")
+
+
+class _LRUCache(OrderedDict):
+    """Bounded mapping that evicts the least recently stored entry."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class _CachedResponse(NamedTuple):
+    """The parts of a GET response needed to answer a later ``304 Not Modified``."""
+
+    etag: str
+    content: bytes
+    headers: Mapping[str, str]
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+def _cache_key(
+    url: str,
+    params: Mapping[str, Any] | Sequence[tuple[str, Any]] | None,
+) -> tuple[str, tuple[tuple[str, Any], ...]]:
+    if isinstance(params, Mapping):
+        return url, tuple(sorted(params.items()))
+    return url, tuple(params or ())
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honours ``Retry-After`` for at most ``max_retry_after`` seconds.
+
+    urllib3 sleeps for whatever the server asks and ignores the request
+    timeout, so a long ``Retry-After`` would otherwise stall each retry.
+    """
+
+    max_retry_after = 10.0
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on pooled connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        proxy_kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+class TlyClient(
+    _BaseTlyClient[dict[str, Any], list[dict[str, Any]], QRCode, requests.Response]
+):
+    """Python client for the T.LY URL Shortener API."""
+
+    def __init__(
+        self,
+        api_token: str,
+        *,
+        base_url: str = "https://api.t.ly",
+        timeout: float = 30.0,
+        user_agent: str = "tly-url-shortener-api/0.1.0",
+        session: requests.Session | None = None,
+        pool_size: int = 50,
+        retries: int = 3,
+        enable_cache: bool = False,
+        cache: MutableMapping[Any, Any] | None = None,
+        preconnect: bool = False,
+    ) -> None:
+        super().__init__(api_token, base_url=base_url, timeout=timeout, user_agent=user_agent)
+        self.session = session or self._create_session(pool_size, retries)
+        if cache is not None and not enable_cache:
+            raise ValueError("cache requires enable_cache=True")
+        if cache is None and enable_cache:
+            cache = _LRUCache()
+        # GET responses keyed by (url, params); revalidated with If-None-Match.
+        self.cache = cache
+        # The pooled session may be shared between threads; LRU bookkeeping
+        # reorders and evicts entries, so every cache access holds this lock.
+        self._cache_lock = threading.Lock()
+        self.preconnect = preconnect
+        self._preconnect_thread: threading.Thread | None = None
+
+    @staticmethod
+    def _create_session(pool_size: int, retries: int) -> requests.Session:
+        session = requests.Session()
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=_CappedRetry(
+                total=retries,
+                backoff_factor=0.25,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=_RETRY_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        thread = self._preconnect_thread
+        if thread is not None:
+            # Don't pull the session out from under a warm-up that is still running.
+            thread.join(_PRECONNECT_JOIN_TIMEOUT)
+            self._preconnect_thread = None
+        self.session.close()
+
+    def __enter__(self) -> "TlyClient":
+        if self.preconnect and self._preconnect_thread is None:
+            # Open the pooled connection (TCP + TLS) while the caller keeps working.
+            # Requests never wait for it: one issued first simply dials its own.
+            self._preconnect_thread = threading.Thread(
+                target=self._warm_up, name="tly-preconnect", daemon=True
+            )
+            self._preconnect_thread.start()
+        return self
+
+    def _warm_up(self) -> None:
+        try:
+            self.session.head(self.base_url, timeout=self.timeout)
+        except Exception:
+            # Best effort: the real request reports connection errors itself.
+            logger.debug("Preconnect to %s failed", self.base_url, exc_info=True)
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | Sequence[tuple[str, Any]] | None = None,
+        json_body: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        expect_binary: bool = False,
+        fields: Sequence[str] | None = None,
+        stream: bool = False,
+    ) -> Any:
+        method = method.upper()
+        url = self._build_url(path)
+        cache = self.cache if method == "GET" and not stream else None
+        cache_key = cached = None
+        if cache is not None:
+            cache_key = _cache_key(url, params)
+            with self._cache_lock:
+                cached = cache.get(cache_key)
+            if cached is not None:
+                headers = {**(headers or {}), "If-None-Match": cached.etag}
+
+        response = self.session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=_json.dumps(json_body) if json_body is not None else None,
+            headers=self._build_headers(headers),
+            timeout=self.timeout,
+            stream=stream,
+        )
+        if cache is not None:
+            if cached is not None and response.status_code == 304:
+                with self._cache_lock:
+                    cache[cache_key] = cached
+                return self._parse_response(cached, expect_binary=expect_binary, fields=fields)
+            etag = response.headers.get("ETag") if response.status_code < 400 else None
+            with self._cache_lock:
+                if etag:
+                    cache[cache_key] = _CachedResponse(etag, response.content, response.headers)
+                else:
+                    # A stale validator would be resent on every later call.
+                    cache.pop(cache_key, None)
+        self._raise_for_status(response)
+        if expect_binary and stream:
+            return response
+        return self._parse_response(response, expect_binary=expect_binary, fields=fields)
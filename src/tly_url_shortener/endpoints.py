@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
 
 
 @dataclass(frozen=True)
 class Endpoint:
+    # Declared by hand because dataclass(slots=True) needs Python 3.10.
+    __slots__ = ("group", "label", "method", "path")
+
     method: str
     path: str
     group: str
     label: str
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Frozen slotted instances cannot be restored attribute by attribute.
+        return type(self), (self.method, self.path, self.group, self.label)
+
 
-ENDPOINTS: dict[str, Endpoint] = {
+_ENDPOINTS: dict[str, Endpoint] = {
     "get_onelink_stats": Endpoint(
         method="GET",
         path="/api/v1/onelink/stats",
@@ -188,5 +198,6 @@ ENDPOINTS: dict[str, Endpoint] = {
     ),
 }
 
+ENDPOINTS: Mapping[str, Endpoint] = MappingProxyType(_ENDPOINTS)
 
-SUPPORTED_METHODS: tuple[str, ...] = tuple(ENDPOINTS.keys())
+SUPPORTED_METHODS: frozenset[str] = frozenset(ENDPOINTS)
@@ -0,0 +1,65 @@
+"""Test doubles for the requests session used by TlyClient."""
+
+from __future__ import annotations
+
+import json
+from collections import namedtuple
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+_DEFAULT_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+class DummyResponse:
+    __slots__ = ("_json_data", "content", "headers", "status_code", "text")
+
+    def __init__(
+        self,
+        *,
+        status_code: int = 200,
+        json_data: Any = None,
+        text: str = "",
+        headers: Mapping[str, str] | None = None,
+        content: bytes = b"",
+    ) -> None:
+        if json_data is not None and not content:
+            content = json.dumps(json_data).encode("utf-8")
+        self.status_code = status_code
+        self._json_data = json_data
+        self.text = text or content.decode("utf-8", errors="replace")
+        self.headers = headers if headers is not None else _DEFAULT_HEADERS
+        self.content = content
+
+    def json(self) -> Any:
+        if self._json_data is not None:
+            return self._json_data
+        raise ValueError("No JSON")
+
+
+# The fields tests inspect; ``json`` is the decoded request body.
+Call = namedtuple("Call", "method url json params headers stream")
+
+
+class DummySession:
+    __slots__ = ("last_call", "response")
+
+    def __init__(self, response: DummyResponse) -> None:
+        self.response = response
+        self.last_call: Call | None = None
+
+    def request(self, **kwargs: Any) -> DummyResponse:
+        data = kwargs.get("data")
+        self.last_call = Call(
+            kwargs.get("method"),
+            kwargs.get("url"),
+            json.loads(data) if data is not None else None,
+            kwargs.get("params"),
+            kwargs.get("headers"),
+            kwargs.get("stream"),
+        )
+        return self.response
+
+    def close(self) -> None:
+        return None
+
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from tly_url_shortener import AsyncTlyClient, TlyAPIError
+
+
+def _make_client(handler) -> AsyncTlyClient:
+    return AsyncTlyClient(
+        api_token="token",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_create_short_link_payload() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"short_url": "https://t.ly/abc"})
+
+    async def run() -> dict:
+        async with _make_client(handler) as client:
+            return await client.create_short_link(long_url="https://example.com")
+
+    result = asyncio.run(run())
+
+    assert result == {"short_url": "https://t.ly/abc"}
+    assert seen[0].method == "POST"
+    assert str(seen[0].url) == "https://api.t.ly/api/v1/link/shorten"
+    assert seen[0].headers["Authorization"] == "Bearer token"
+    assert json.loads(seen[0].content) == {"long_url": "https://example.com"}
+
+
+def test_gather_shorten_preserves_order() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        long_url = json.loads(request.content)["long_url"]
+        return httpx.Response(200, json={"long_url": long_url})
+
+    async def run() -> list:
+        async with _make_client(handler) as client:
+            return await client.gather_shorten(
+                [f"https://example.com/{i}" for i in range(10)], concurrency=3
+            )
+
+    results = asyncio.run(run())
+
+    assert [r["long_url"] for r in results] == [f"https://example.com/{i}" for i in range(10)]
+
+
+def test_api_error_raised() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(422, json={"message": "Validation failed"})
+
+    async def run() -> None:
+        async with _make_client(handler) as client:
+            await client.create_tag("bad")
+
+    with pytest.raises(TlyAPIError) as exc:
+        asyncio.run(run())
+
+    assert exc.value.status_code == 422
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_gather_calls_rejects_non_positive_concurrency(concurrency: int) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with _make_client(handler) as client:
+            await client.gather_shorten(["https://example.com"], concurrency=concurrency)
+
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(run())
+
+    with pytest.raises(ValueError, match="concurrency"):
+        AsyncTlyClient(api_token="token", concurrency=concurrency)
+
+
+
+def test_gather_shorten_keeps_results_when_one_call_fails() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        long_url = json.loads(request.content)["long_url"]
+        if long_url.endswith("/bad"):
+            return httpx.Response(422, json={"message": "Invalid URL"})
+        return httpx.Response(200, json={"long_url": long_url})
+
+    async def run() -> list:
+        async with _make_client(handler) as client:
+            return await client.gather_shorten(
+                ["https://example.com/a", "https://example.com/bad", "https://example.com/c"]
+            )
+
+    first, failed, last = asyncio.run(run())
+
+    assert first == {"long_url": "https://example.com/a"}
+    assert isinstance(failed, TlyAPIError)
+    assert failed.status_code == 422
+    assert last == {"long_url": "https://example.com/c"}
@@ -1,27 +1,141 @@
 from __future__ import annotations
 
-from tly_url_shortener import cli
+import io
+import json
+
+import pytest
+
+from tly_url_shortener import async_client, cli, client
+from tly_url_shortener.exceptions import TlyAPIError
+
+
+class DummyStreamedResponse:
+    def __init__(self, body: bytes) -> None:
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self) -> "DummyStreamedResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
 
 
 class DummyClient:
-    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    def __init__(self, *args, **kwargs) -> None:
         return None
 
     def __enter__(self) -> "DummyClient":
         return self
 
-    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+    def __exit__(self, exc_type, exc, tb) -> None:
         return None
 
     def create_tag(self, *, tag: str) -> dict[str, str]:
         return {"tag": tag}
 
+    def get_qr_code(self, **kwargs) -> DummyStreamedResponse:
+        assert kwargs["stream"] is True
+        return DummyStreamedResponse(b"\x89PNG")
+
 
-def test_call_rejects_non_object_json(monkeypatch, capsys) -> None:  # noqa: ANN001
-    monkeypatch.setattr(cli, "TlyClient", DummyClient)
+def test_call_rejects_non_object_json(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(client, "TlyClient", DummyClient)
 
     exit_code = cli.main(["--token", "token", "call", "create_tag", "--data", "[]"])
 
     captured = capsys.readouterr()
     assert exit_code == 2
     assert "--data must be a JSON object" in captured.err
+
+
+def test_find_command_skips_option_values() -> None:
+    assert cli._find_command(["--token", "call", "--timeout", "5", "qr", "--out", "x"]) == "qr"
+    assert cli._find_command(["--help"]) is None
+
+
+def test_global_options_cannot_be_abbreviated(capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--tok", "list_tags", "call", "list_tags"])
+
+    assert exc.value.code == 2
+    assert "invalid choice: 'list_tags'" in capsys.readouterr().err
+
+
+def test_qr_streams_to_out_file(monkeypatch, capsys, tmp_path) -> None:
+    monkeypatch.setattr(client, "TlyClient", DummyClient)
+    out = tmp_path / "qr.png"
+
+    exit_code = cli.main(
+        ["--token", "token", "qr", "--short-url", "https://t.ly/a", "--out", str(out)]
+    )
+
+    assert exit_code == 0
+    assert out.read_bytes() == b"\x89PNG"
+    assert capsys.readouterr().out.strip() == str(out)
+
+
+class BrokenStream(io.BytesIO):
+    def read(self, size: int = -1) -> bytes:
+        if self.tell():
+            raise ConnectionError("connection reset")
+        return super().read(2)
+
+
+def test_qr_failed_download_leaves_no_file(monkeypatch, tmp_path) -> None:
+    response = DummyStreamedResponse(b"\x89PNG")
+    response.raw = BrokenStream(b"\x89PNG")
+    monkeypatch.setattr(DummyClient, "get_qr_code", lambda self, **kwargs: response)
+    monkeypatch.setattr(client, "TlyClient", DummyClient)
+    out = tmp_path / "qr.png"
+
+    exit_code = cli.main(
+        ["--token", "token", "qr", "--short-url", "https://t.ly/a", "--out", str(out)]
+    )
+
+    assert exit_code == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_call_rejects_non_positive_concurrency(capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--token", "token", "call", "create_tag", "--async", "--concurrency", "0"])
+
+    assert exc.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
+
+
+def test_call_usage_lists_methods() -> None:
+    parser = cli._build_parser(commands=("call",))
+    subparsers = next(a for a in parser._actions if a.dest == "command")
+
+    usage = subparsers.choices["call"].format_usage()
+
+    assert "{bulk_shorten_links,bulk_update_links," in usage
+
+
+class DummyAsyncClient:
+    def __init__(self, *args, **kwargs) -> None:
+        return None
+
+    async def __aenter__(self) -> "DummyAsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    async def gather_calls(self, method: str, payloads: list) -> list:
+        return [{"tag": "a"}, TlyAPIError(status_code=422, message="Tag taken")]
+
+
+def test_async_call_reports_failures_in_place(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(async_client, "AsyncTlyClient", DummyAsyncClient)
+
+    exit_code = cli.main(
+        ["--token", "token", "call", "create_tag", "--async", "--data", '[{"tag":"a"},{"tag":"b"}]']
+    )
+
+    assert exit_code == 1
+    assert json.loads(capsys.readouterr().out) == [
+        {"tag": "a"},
+        {"error": "Tag taken", "status_code": 422},
+    ]
@@ -1,120 +1,296 @@
 from __future__ import annotations
 
+import copy
+import inspect
+import pickle
+import socket
+import threading
+from collections.abc import Callable
+from datetime import date, datetime
 from typing import Any
 
 import pytest
+from client_doubles import DummyResponse, DummySession
+from urllib3 import HTTPResponse
 
-from tly_url_shortener import TlyAPIError, TlyClient
+from tly_url_shortener.client import TlyClient
+from tly_url_shortener.endpoints import ENDPOINTS
+from tly_url_shortener.exceptions import TlyAPIError
 
+ClientFactory = Callable[..., TlyClient]
 
-class DummyResponse:
-    def __init__(
-        self,
-        *,
-        status_code: int = 200,
-        json_data: Any = None,
-        text: str = "",
-        headers: dict[str, str] | None = None,
-        content: bytes = b"",
-    ) -> None:
-        self.status_code = status_code
-        self._json_data = json_data
-        self.text = text
-        self.headers = headers or {"Content-Type": "application/json"}
-        self.content = content
+_EXPECTED_AUTH = "Bearer token"
+_SHORTEN_URL = "https://api.t.ly/api/v1/link/shorten"
 
-    def json(self) -> Any:
-        if self._json_data is not None:
-            return self._json_data
-        raise ValueError("No JSON")
 
+@pytest.fixture(scope="module")
+def client_factory() -> ClientFactory:
+    def make(response: DummyResponse, **kwargs: Any) -> TlyClient:
+        return TlyClient(api_token="token", session=DummySession(response), **kwargs)
 
-class DummySession:
-    def __init__(self, response: DummyResponse) -> None:
-        self.response = response
-        self.calls: list[dict[str, Any]] = []
+    return make
 
-    def request(self, **kwargs: Any) -> DummyResponse:
-        self.calls.append(kwargs)
-        return self.response
 
-    def close(self) -> None:
-        return None
+@pytest.fixture
+def json_client(request: pytest.FixtureRequest, client_factory: ClientFactory) -> TlyClient:
+    """Client whose session answers every call with ``request.param`` as JSON."""
+    return client_factory(DummyResponse(json_data=request.param))
 
 
-def test_create_short_link_payload() -> None:
-    session = DummySession(DummyResponse(json_data={"short_url": "https://t.ly/abc"}))
-    client = TlyClient(api_token="token", session=session)
-
-    result = client.create_short_link(long_url="https://example.com", description="d")
+@pytest.mark.parametrize(
+    ("options", "expected_body"),
+    [
+        ({"description": "d"}, {"long_url": "https://example.com", "description": "d"}),
+        ({"meta": [[]]}, {"long_url": "https://example.com", "meta": [[]]}),
+        ({"meta": {1: "x"}}, {"long_url": "https://example.com", "meta": {"1": "x"}}),
+    ],
+)
+@pytest.mark.parametrize("json_client", [{"short_url": "https://t.ly/abc"}], indirect=True)
+def test_create_short_link_payload(
+    json_client: TlyClient, options: dict[str, Any], expected_body: dict[str, Any]
+) -> None:
+    result = json_client.create_short_link(long_url="https://example.com", **options)
 
     assert result["short_url"] == "https://t.ly/abc"
-    call = session.calls[0]
-    assert call["method"] == "POST"
-    assert call["url"] == "https://api.t.ly/api/v1/link/shorten"
-    assert call["json"]["long_url"] == "https://example.com"
-    assert call["json"]["description"] == "d"
-    assert call["headers"]["Authorization"] == "Bearer token"
+    call = json_client.session.last_call
+    expected = {"method": "POST", "url": _SHORTEN_URL, "json": expected_body}
+    assert {key: getattr(call, key) for key in expected} == expected
+    assert call.headers["Authorization"] == _EXPECTED_AUTH
+
+
+@pytest.mark.parametrize("json_client", [{"data": []}], indirect=True)
+def test_list_short_links_uses_indexed_arrays(json_client: TlyClient) -> None:
+    json_client.list_short_links(tag_ids=[1, 2], pixel_ids=[8], domains=[3, 4])
+
+    params = set(json_client.session.last_call.params)
+    assert {
+        ("tag_ids[0]", "1"),
+        ("tag_ids[1]", "2"),
+        ("pixel_ids[0]", "8"),
+        ("domains[0]", "3"),
+        ("domains[1]", "4"),
+    } <= params
+
+
+@pytest.mark.parametrize(
+    ("response_kwargs", "output", "expected_type", "expected_accept"),
+    [
+        (
+            {"headers": {"Content-Type": "image/png"}, "content": b"\x89PNG"},
+            "image",
+            bytes,
+            "image/png,*/*",
+        ),
+        (
+            {"json_data": {"base64": "data:image/png;base64,AAAA"}},
+            "base64",
+            dict,
+            "application/json",
+        ),
+    ],
+    ids=["image", "base64"],
+)
+def test_get_qr_code(
+    client_factory: ClientFactory,
+    response_kwargs: dict[str, Any],
+    output: str,
+    expected_type: type,
+    expected_accept: str,
+) -> None:
+    response = DummyResponse(**response_kwargs)
+    client = client_factory(response)
+
+    data = client.get_qr_code("https://t.ly/abc", output=output)
+
+    assert isinstance(data, expected_type)
+    assert data == (response.content if output == "image" else response.json())
+    assert client.session.last_call.headers["accept"] == expected_accept
+    assert client.default_headers["Accept"] == "application/json"
+
+
+def test_get_qr_code_stream_returns_response(client_factory: ClientFactory) -> None:
+    response = DummyResponse(headers={"Content-Type": "image/png"}, content=b"\x89PNG")
+    client = client_factory(response)
+
+    result = client.get_qr_code("https://t.ly/abc", stream=True)
+
+    assert result is response
+    assert client.session.last_call.stream is True
+
+
+def test_api_error_raised(client_factory: ClientFactory) -> None:
+    client = client_factory(
+        DummyResponse(
+            status_code=422,
+            json_data={"message": "Validation failed"},
+            text='{"message":"Validation failed"}',
+        )
+    )
+
+    with pytest.raises(TlyAPIError, match="Validation failed") as exc:
+        client.create_tag("bad")
 
+    assert exc.value.status_code == 422
 
-def test_create_short_link_allows_non_mapping_meta() -> None:
-    session = DummySession(DummyResponse(json_data={"short_url": "https://t.ly/abc"}))
-    client = TlyClient(api_token="token", session=session)
 
-    client.create_short_link(long_url="https://example.com", meta=[[]])
+def test_list_short_links_projects_fields(client_factory: ClientFactory) -> None:
+    records = [
+        {"short_url": "https://t.ly/a", "long_url": "https://a.example", "description": "a"},
+        {"short_url": "https://t.ly/b", "long_url": "https://b.example", "tags": [1]},
+    ]
+    client = client_factory(DummyResponse(json_data={"current_page": 1, "data": records}))
 
-    call = session.calls[0]
-    assert call["json"]["meta"] == [[]]
+    result = client.list_short_links(fields=("short_url", "long_url"))
 
+    assert result == {
+        "current_page": 1,
+        "data": [
+            {"short_url": "https://t.ly/a", "long_url": "https://a.example"},
+            {"short_url": "https://t.ly/b", "long_url": "https://b.example"},
+        ],
+    }
 
-def test_list_short_links_uses_indexed_arrays() -> None:
-    session = DummySession(DummyResponse(json_data={"data": []}))
-    client = TlyClient(api_token="token", session=session)
 
-    client.list_short_links(tag_ids=[1, 2], pixel_ids=[8], domains=[3, 4])
+def test_default_session_mounts_pooled_adapter() -> None:
+    client = TlyClient(api_token="token", pool_size=4, retries=5)
 
-    params = session.calls[0]["params"]
-    assert ("tag_ids[0]", "1") in params
-    assert ("tag_ids[1]", "2") in params
-    assert ("pixel_ids[0]", "8") in params
-    assert ("domains[0]", "3") in params
-    assert ("domains[1]", "4") in params
+    adapter = client.session.get_adapter("https://api.t.ly")
 
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 5
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    response = HTTPResponse(headers={"Retry-After": "60"})
+    assert adapter.max_retries.new(total=1).get_retry_after(response) == 10.0
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
 
-def test_get_qr_code_binary() -> None:
-    session = DummySession(
-        DummyResponse(
-            headers={"Content-Type": "image/png"},
-            content=b"\x89PNG",
-            text="",
-        )
-    )
-    client = TlyClient(api_token="token", session=session)
 
-    data = client.get_qr_code("https://t.ly/abc", output="image")
+def test_request_accepts_relative_path(client_factory: ClientFactory) -> None:
+    client = client_factory(DummyResponse(json_data=[]), base_url="https://api.t.ly/")
 
-    assert isinstance(data, bytes)
-    assert data == b"\x89PNG"
+    client.request("GET", "api/v1/link/tag")
 
+    assert client.session.last_call.url == "https://api.t.ly/api/v1/link/tag"
 
-def test_get_qr_code_base64_json() -> None:
-    session = DummySession(DummyResponse(json_data={"base64": "data:image/png;base64,AAAA"}))
-    client = TlyClient(api_token="token", session=session)
 
-    data = client.get_qr_code("https://t.ly/abc", output="base64")
+@pytest.mark.parametrize("name", sorted(ENDPOINTS))
+def test_client_methods_match_endpoints(name: str, client_factory: ClientFactory) -> None:
+    client = client_factory(DummyResponse(json_data={}))
+    method = getattr(client, name)
+    required = {
+        param.name: "x"
+        for param in inspect.signature(method).parameters.values()
+        if param.default is inspect.Parameter.empty
+    }
 
-    assert isinstance(data, dict)
-    assert "base64" in data
+    method(**required)
 
+    endpoint = ENDPOINTS[name]
+    call = client.session.last_call
+    assert call.method == endpoint.method
+    assert call.url == "https://api.t.ly" + endpoint.path.format(id="x")
 
-def test_api_error_raised() -> None:
-    session = DummySession(
-        DummyResponse(status_code=422, json_data={"message": "Validation failed"}, text='{"message":"Validation failed"}')
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"  \n", {}),
+        (b'\n {"ok": true}', {"ok": True}),
+        (b" plain text \n", "plain text"),
+    ],
+)
+def test_parse_response_sniffs_body(
+    content: bytes, expected: Any, client_factory: ClientFactory
+) -> None:
+    response = DummyResponse(headers={"Content-Type": "text/plain"}, content=content)
+    client = client_factory(response)
+
+    assert client.request("GET", "/api/v1/link") == expected
+
+
+def test_get_link_stats_formats_dates(client_factory: ClientFactory) -> None:
+    client = client_factory(DummyResponse(json_data={}))
+
+    client.get_link_stats(
+        "https://t.ly/abc",
+        start_date=date(2026, 1, 2),
+        end_date=datetime(2026, 1, 3, 4, 5, 6),
     )
-    client = TlyClient(api_token="token", session=session)
 
-    with pytest.raises(TlyAPIError) as exc:
-        client.create_tag("bad")
+    assert client.session.last_call.params == {
+        "short_url": "https://t.ly/abc",
+        "start_date": "2026-01-02",
+        "end_date": "2026-01-03T04:05:06",
+    }
 
-    assert exc.value.status_code == 422
-    assert "Validation failed" in str(exc.value)
+
+def test_get_revalidates_cached_response_with_etag(client_factory: ClientFactory) -> None:
+    first = DummyResponse(
+        json_data=[{"id": 1, "tag": "a"}],
+        headers={"Content-Type": "application/json", "ETag": '"v1"'},
+    )
+    client = client_factory(first, enable_cache=True)
+
+    assert client.list_tags() == [{"id": 1, "tag": "a"}]
+    assert "If-None-Match" not in client.session.last_call.headers
+    client.session.response = DummyResponse(status_code=304, headers={})
+
+    assert client.list_tags() == [{"id": 1, "tag": "a"}]
+    assert client.session.last_call.headers["If-None-Match"] == '"v1"'
+
+    client.session.response = DummyResponse(json_data=[])
+    assert client.list_tags() == []
+    assert not client.cache
+    client.list_tags()
+    assert "If-None-Match" not in client.session.last_call.headers
+
+
+def test_cache_requires_enable_cache() -> None:
+    with pytest.raises(ValueError, match="enable_cache"):
+        TlyClient(api_token="token", cache={})
+
+
+def test_endpoint_copies_and_pickles() -> None:
+    endpoint = ENDPOINTS["create_short_link"]
+
+    assert not hasattr(endpoint, "__dict__")
+    assert copy.deepcopy(endpoint) == endpoint
+    assert pickle.loads(pickle.dumps(endpoint)) == endpoint
+
+
+def test_preconnect_overlaps_requests_and_finishes_before_close() -> None:
+    events: list[str] = []
+    request_sent = threading.Event()
+
+    class RecordingSession(DummySession):
+        def head(self, url: str, **kwargs: Any) -> None:
+            request_sent.wait(5)
+            events.append(f"head {url}")
+
+        def request(self, **kwargs: Any) -> DummyResponse:
+            events.append("request")
+            request_sent.set()
+            return super().request(**kwargs)
+
+        def close(self) -> None:
+            events.append("close")
+
+    session = RecordingSession(DummyResponse(json_data=[]))
+    with TlyClient(api_token="token", session=session, preconnect=True) as client:
+        assert client.list_tags() == []
+
+    assert events == ["request", "head https://api.t.ly", "close"]
+
+
+def test_preconnect_failure_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    class UnreachableSession(DummySession):
+        def head(self, url: str, **kwargs: Any) -> None:
+            raise ConnectionError("unreachable")
+
+    session = UnreachableSession(DummyResponse(json_data=[]))
+    caplog.set_level("DEBUG", logger="tly_url_shortener.client")
+    with TlyClient(api_token="token", session=session, preconnect=True):
+        pass
+
+    assert "Preconnect to https://api.t.ly failed" in caplog.text